@@ -0,0 +1,295 @@
+import sys
+import json
+import time
+import asyncio
+import statistics
+
+
+# Same cycle as PomodoroApp: 25 min work, 5 min short break,
+# 15 min long break after every 4th work session
+WORK_TIME = 25 * 60
+SHORT_BREAK = 5 * 60
+LONG_BREAK = 15 * 60
+
+
+def next_phase(phase, sessions_completed):
+    """Phase that follows `phase`, mirroring PomodoroApp.timer_complete.
+
+    Returns (phase, sessions_completed) where phase is one of
+    "work", "short_break" or "long_break".
+    """
+    if phase == "work":
+        sessions_completed += 1
+        if sessions_completed % 4 == 0:
+            return "long_break", sessions_completed
+        return "short_break", sessions_completed
+    return "work", sessions_completed
+
+
+class Subscriber:
+    """One client of a room.
+
+    Messages are queued rather than written inline so a slow socket can
+    never hold up the rest of a broadcast. When the queue is full the
+    oldest message is dropped: each one carries the full room state, so
+    only the newest matters.
+    """
+
+    def __init__(self, send, max_pending=4):
+        self.send = send
+        self.queue = asyncio.Queue(max_pending)
+        self.dropped = 0
+        self.task = None
+
+    def push(self, message):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def pump(self):
+        while True:
+            message = await self.queue.get()
+            await self.send(message)
+
+    def start(self):
+        self.task = asyncio.get_running_loop().create_task(self.pump())
+
+    def stop(self):
+        if self.task:
+            self.task.cancel()
+
+
+class FocusRoom:
+    """A shared pomodoro timer owned by the server.
+
+    Only state changes are broadcast (phase transitions, start, pause,
+    reset), each carrying the wall-clock deadline of the current phase.
+    Clients run their own per-second countdown towards it.
+    """
+
+    def __init__(self, name, work_time=WORK_TIME, short_break=SHORT_BREAK, long_break=LONG_BREAK):
+        self.name = name
+        self.durations = {
+            "work": work_time,
+            "short_break": short_break,
+            "long_break": long_break,
+        }
+        self.phase = "work"
+        self.sessions_completed = 0
+        self.remaining = work_time
+        self.deadline = None
+        self.subscribers = set()
+        self.message = None
+        self.broadcasts = 0
+        self._handle = None
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    def state(self):
+        return {
+            "type": "state",
+            "room": self.name,
+            "phase": self.phase,
+            "sessions": self.sessions_completed,
+            "running": self.running,
+            "duration": self.durations[self.phase],
+            "remaining": self.remaining,
+            "deadline": self.deadline,
+            "sent_at": time.time(),
+        }
+
+    def broadcast(self):
+        # Serialised once per change, shared by every subscriber
+        self.message = json.dumps(self.state())
+        self.broadcasts += 1
+        for subscriber in self.subscribers:
+            subscriber.push(self.message)
+
+    def join(self, subscriber):
+        self.subscribers.add(subscriber)
+        if self.message is None:
+            self.message = json.dumps(self.state())
+        subscriber.push(self.message)
+
+    def leave(self, subscriber):
+        self.subscribers.discard(subscriber)
+
+    def start(self):
+        if self.running:
+            return
+        self.deadline = time.time() + self.remaining
+        self._schedule()
+        self.broadcast()
+
+    def pause(self):
+        if not self.running:
+            return
+        self.remaining = max(0, round(self.deadline - time.time()))
+        self.deadline = None
+        self._cancel()
+        self.broadcast()
+
+    def reset(self):
+        self._cancel()
+        self.deadline = None
+        self.remaining = self.durations[self.phase]
+        self.broadcast()
+
+    def close(self):
+        self._cancel()
+        for subscriber in self.subscribers:
+            subscriber.stop()
+        self.subscribers.clear()
+
+    def _schedule(self):
+        loop = asyncio.get_running_loop()
+        delay = max(0.0, self.deadline - time.time())
+        self._handle = loop.call_later(delay, self._phase_complete)
+
+    def _cancel(self):
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+    def _phase_complete(self):
+        # Like the app, the next phase starts automatically
+        self.phase, self.sessions_completed = next_phase(self.phase, self.sessions_completed)
+        self.remaining = self.durations[self.phase]
+        self.deadline = time.time() + self.remaining
+        self._schedule()
+        self.broadcast()
+
+
+class FocusRoomServer:
+    """Asyncio WebSocket server hosting any number of focus rooms.
+
+    Clients send JSON commands {"action": ..., "room": ...} where action
+    is "join", "start", "pause" or "reset", and receive the room state
+    as JSON whenever it changes.
+    """
+
+    def __init__(self, **room_settings):
+        self.rooms = {}
+        self.room_settings = room_settings
+
+    def room(self, name):
+        if name not in self.rooms:
+            self.rooms[name] = FocusRoom(name, **self.room_settings)
+        return self.rooms[name]
+
+    def leave(self, room, subscriber):
+        """Drop a subscriber, and the room itself once nobody is left in it"""
+        room.leave(subscriber)
+        if not room.subscribers:
+            room.close()
+            if self.rooms.get(room.name) is room:
+                del self.rooms[room.name]
+
+    async def handler(self, websocket):
+        subscriber = Subscriber(websocket.send)
+        subscriber.start()
+        room = None
+        try:
+            async for raw in websocket:
+                try:
+                    command = json.loads(raw)
+                    action = command["action"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if action == "join":
+                    if room:
+                        self.leave(room, subscriber)
+                    room = self.room(str(command.get("room", "default")))
+                    room.join(subscriber)
+                elif room and action in ("start", "pause", "reset"):
+                    getattr(room, action)()
+        finally:
+            if room:
+                self.leave(room, subscriber)
+            subscriber.stop()
+
+    async def serve(self, host="localhost", port=8765):
+        try:
+            import websockets
+        except ImportError:
+            raise RuntimeError("Focus rooms need the 'websockets' package: pip install websockets")
+
+        async with websockets.serve(self.handler, host, port):
+            print(f"Focus rooms listening on ws://{host}:{port}")
+            await asyncio.Future()
+
+
+async def load_test(clients=10000, transitions=10, phase_seconds=0.2):
+    """Fan a room's transitions out to in-process clients and report latency.
+
+    Each simulated client goes through the same Subscriber queue as a real
+    socket; latency is measured from the moment the room serialises a
+    message to the moment the client's pump hands it to `send`.
+    """
+    room = FocusRoom("load-test", phase_seconds, phase_seconds, phase_seconds)
+    latencies = []
+    received = 0
+    done = asyncio.Event()
+
+    sent_at = {}
+
+    async def receive(message):
+        nonlocal received
+        # Every client gets the same string object, so parse it only once
+        if message not in sent_at:
+            sent_at[message] = json.loads(message)["sent_at"]
+        latencies.append(time.time() - sent_at[message])
+        received += 1
+        if received >= clients * (transitions + 1):
+            done.set()
+
+    for _ in range(clients):
+        subscriber = Subscriber(receive)
+        subscriber.start()
+        room.join(subscriber)
+
+    # Drain the initial join messages before timing transitions
+    while received < clients:
+        await asyncio.sleep(0.01)
+    latencies.clear()
+    received = 0
+
+    started = time.perf_counter()
+    # The start broadcast is the first of `transitions + 1` rounds
+    room.start()
+    await asyncio.wait_for(done.wait(), timeout=60 + transitions * phase_seconds)
+    elapsed = time.perf_counter() - started
+    room.close()
+
+    latencies.sort()
+    return {
+        "clients": clients,
+        "broadcasts": room.broadcasts,
+        "messages": len(latencies),
+        "seconds": elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "load-test":
+        clients = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+        report = asyncio.run(load_test(clients))
+        print(f"{report['clients']} clients, {report['broadcasts']} broadcasts, "
+              f"{report['messages']} messages delivered in {report['seconds']:.2f}s")
+        print(f"Broadcast latency: p50 {report['p50_ms']:.1f} ms, "
+              f"p99 {report['p99_ms']:.1f} ms, max {report['max_ms']:.1f} ms")
+        return
+
+    host = sys.argv[1] if len(sys.argv) > 1 else "localhost"
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+    asyncio.run(FocusRoomServer().serve(host, port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+import os
+import json
+import time
+import heapq
+import threading
+import importlib.util
+import urllib.request
+from collections import deque
+
+
+EVENTS = ("session_start", "session_complete", "pause", "goal_progress")
+
+
+class Hook:
+    """Base class for integrations fired on timer events.
+
+    Override any of the on_<event> methods; each receives the event payload
+    as a dict. Handlers never run on the GUI thread. A handler that raises
+    is retried up to `retries` times, waiting backoff, 2*backoff,
+    4*backoff... seconds between attempts.
+
+    A hook's calls run one at a time, in the order the events happened.
+    Each call gets `timeout` seconds. After that it is counted as timed out,
+    not retried, and the dispatcher moves on. Python cannot kill a thread,
+    so the call itself keeps running; while `max_in_flight` such overdue
+    calls of a hook are still running, its new events are dropped. Hooks
+    doing I/O should pass `timeout` to their own network calls too.
+    """
+
+    name = None
+    timeout = 5.0
+    retries = 2
+    backoff = 0.5
+    max_in_flight = 1
+
+    def on_session_start(self, event):
+        pass
+
+    def on_session_complete(self, event):
+        pass
+
+    def on_pause(self, event):
+        pass
+
+    def on_goal_progress(self, event):
+        pass
+
+    def handled_events(self):
+        return {event for event in EVENTS
+                if getattr(type(self), "on_" + event) is not getattr(Hook, "on_" + event)}
+
+
+class LogHook(Hook):
+    """Appends every event to a JSON-lines file"""
+
+    def __init__(self, path="pomodoro_events.jsonl"):
+        self.path = path
+        self.name = f"log:{path}"
+        self.lock = threading.Lock()
+
+    def write(self, event):
+        with self.lock, open(self.path, "a") as f:
+            f.write(json.dumps(event) + "\n")
+
+    on_session_start = on_session_complete = on_pause = on_goal_progress = write
+
+
+class HttpHook(Hook):
+    """POSTs every event as JSON to a (typically local) HTTP endpoint"""
+
+    def __init__(self, url, timeout=2.0):
+        self.url = url
+        self.name = f"http:{url}"
+        self.timeout = timeout
+
+    def post(self, event):
+        request = urllib.request.Request(
+            self.url, data=json.dumps(event).encode(),
+            headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    on_session_start = on_session_complete = on_pause = on_goal_progress = post
+
+
+class HookStats:
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.dropped = 0
+        self.in_flight = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'failures': self.failures,
+            'timeouts': self.timeouts,
+            'retries': self.retries,
+            'dropped': self.dropped,
+            'in_flight': self.in_flight,
+            'avg_latency': self.total_latency / self.calls if self.calls else 0.0,
+            'max_latency': self.max_latency,
+        }
+
+
+class HookDispatcher:
+    """Runs hooks off the GUI thread.
+
+    A small pool of worker threads takes calls off the queue, starts each on
+    its own thread and waits for it no longer than the hook's timeout, so a
+    hung hook delays the others by at most that much. Calls for a hook that
+    is already being served wait their turn in the queue.
+
+    emit() only appends to a bounded queue and returns, so the timer never
+    waits on an integration. When more than max_pending calls are waiting
+    the oldest one is dropped and counted against its hook. Workers are
+    started on the first register().
+    """
+
+    def __init__(self, workers=2, max_pending=100):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.hooks = []
+        self.handlers = {event: [] for event in EVENTS}
+        self.stats = {}
+        self._ready = deque()
+        self._delayed = []  # Retries waiting out their backoff: (due, seq, job)
+        self._seq = 0
+        self._busy = set()  # Names of hooks a worker is currently serving
+        self._cond = threading.Condition()
+        self._threads = []
+        self._stopping = False
+
+    def register(self, hook):
+        if hook.name is None:
+            hook.name = type(hook).__name__
+        with self._cond:
+            self.hooks.append(hook)
+            self.stats[hook.name] = HookStats()
+            for event in hook.handled_events():
+                self.handlers[event].append(hook)
+        self._start_workers()
+
+    def load_plugins(self, directory):
+        """Import every .py file in directory and call its register(dispatcher).
+
+        Returns a list of error messages for plugins that failed to load.
+        """
+        errors = []
+        if not os.path.isdir(directory):
+            return errors
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(directory, filename)
+            spec = importlib.util.spec_from_file_location(f"pomodoro_plugin_{filename[:-3]}", path)
+            module = importlib.util.module_from_spec(spec)
+            try:
+                spec.loader.exec_module(module)
+                module.register(self)
+            except Exception as e:
+                errors.append(f"Could not load plugin {filename}: {e}")
+        return errors
+
+    def emit(self, event, **payload):
+        hooks = self.handlers[event]
+        if not hooks:
+            return
+        payload['event'] = event
+        with self._cond:
+            for hook in hooks:
+                self._enqueue([hook, event, dict(payload), 0])
+            self._cond.notify(len(hooks))
+
+    def snapshot(self):
+        """Per-hook counters and latencies, safe to read from any thread"""
+        with self._cond:
+            return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def pending(self):
+        with self._cond:
+            return len(self._ready) + len(self._delayed)
+
+    def shutdown(self, wait=True):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _enqueue(self, job):
+        # Caller holds self._cond
+        if len(self._ready) >= self.max_pending:
+            dropped = self._ready.popleft()
+            self.stats[dropped[0].name].dropped += 1
+        self._ready.append(job)
+
+    def _start_workers(self):
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name="pomodoro-hooks", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_job(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    self._enqueue(heapq.heappop(self._delayed)[2])
+                # Oldest call whose hook is free; skipped calls keep their place
+                for i, job in enumerate(self._ready):
+                    if job[0].name not in self._busy:
+                        del self._ready[i]
+                        self._busy.add(job[0].name)
+                        return job
+                if self._stopping and not self._ready:
+                    return None
+                self._cond.wait(self._delayed[0][0] - now if self._delayed else None)
+
+    def _work(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            self._run(job)
+
+    def _run(self, job):
+        try:
+            self._serve(job)
+        finally:
+            with self._cond:
+                self._busy.discard(job[0].name)
+                self._cond.notify_all()
+
+    def _serve(self, job):
+        hook, event, payload, attempt = job
+        with self._cond:
+            stats = self.stats[hook.name]
+            if stats.in_flight >= hook.max_in_flight:
+                # Only calls that overran their timeout can still be running here
+                stats.dropped += 1
+                return
+            stats.in_flight += 1
+
+        started = time.monotonic()
+        finished, error = self._call(hook, getattr(hook, "on_" + event), payload)
+        latency = time.monotonic() - started
+
+        with self._cond:
+            stats.calls += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            if not finished:
+                stats.timeouts += 1
+            elif error is not None:
+                if attempt < hook.retries:
+                    stats.retries += 1
+                    self._seq += 1
+                    due = time.monotonic() + hook.backoff * 2 ** attempt
+                    heapq.heappush(self._delayed, (due, self._seq, [hook, event, payload, attempt + 1]))
+                    self._cond.notify()
+                else:
+                    stats.failures += 1
+
+    def _call(self, hook, handler, payload):
+        """Run handler(payload) on its own daemon thread, waiting at most
+        hook.timeout seconds. Returns (finished, error)."""
+        outcome = {}
+        done = threading.Event()
+
+        def target():
+            try:
+                handler(payload)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                with self._cond:
+                    self.stats[hook.name].in_flight -= 1
+                done.set()
+
+        threading.Thread(target=target, name=f"pomodoro-hook-{hook.name}", daemon=True).start()
+        finished = done.wait(hook.timeout)
+        return finished, outcome.get('error')
+
+
+def check_burst_order(delay=0.01, bursts=5):
+    """Emit the three back-to-back events of a finished session to a hook
+    that takes `delay` seconds per call; every call must arrive, in order."""
+    class SlowRecorder(Hook):
+        def __init__(self):
+            self.events = []
+
+        def record(self, event):
+            time.sleep(delay)
+            self.events.append((event['n'], event['event']))
+
+        on_session_start = on_session_complete = on_pause = on_goal_progress = record
+
+    dispatcher = HookDispatcher()
+    recorder = SlowRecorder()
+    dispatcher.register(recorder)
+    expected = []
+    for n in range(bursts):
+        for event in ("session_complete", "goal_progress", "session_start"):
+            dispatcher.emit(event, n=n)
+            expected.append((n, event))
+    dispatcher.shutdown()
+
+    if recorder.events != expected:
+        raise AssertionError(f"Expected {expected}, got {recorder.events}")
+    stats = dispatcher.snapshot()[recorder.name]
+    if stats['dropped']:
+        raise AssertionError(f"A busy hook dropped {stats['dropped']} events")
+    return stats
+
+
+if __name__ == "__main__":
+    stats = check_burst_order()
+    print(f"Burst check passed: {stats['calls']} calls in order, "
+          f"avg latency {stats['avg_latency'] * 1000:.1f} ms")
@@ -1,24 +1,30 @@
 import sys
 import json
 import os
+import time
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
     QFrame, QProgressBar, QMessageBox, QStackedWidget, QLineEdit,
     QListWidget, QDialog, QInputDialog, QListWidgetItem
 )
-from PyQt6.QtGui import QFont, QPalette, QColor, QBrush, QPixmap
-from PyQt6.QtCore import Qt, QTimer, QDate, QSize
+from PyQt6.QtGui import QFont, QPalette, QColor, QBrush, QPixmap, QPainter, QImage, QPen, QPolygonF
+from PyQt6.QtCore import Qt, QTimer, QDate, QSize, QObject, QRunnable, QThreadPool, QPointF, QRectF, pyqtSignal
 from PyQt6.QtWidgets import QStyle
 from PyQt6.QtMultimedia import QSoundEffect
 from PyQt6.QtCore import QUrl
+from hooks import HookDispatcher, LogHook, HttpHook
+try:
+    from PyQt6.QtWebSockets import QWebSocket
+except ImportError:  # Focus rooms are optional
+    QWebSocket = None
 
 
 class Goal:
-    def __init__(self, name="", target_hours=1, completed_hours=0):
+    def __init__(self, name="", target_hours=1, completed_hours=0, last_updated=None):
         self.name = name
         self.target_hours = target_hours
         self.completed_hours = completed_hours
-        self.last_updated = QDate.currentDate().toString(Qt.DateFormat.ISODate)
+        self.last_updated = last_updated or QDate.currentDate().toString(Qt.DateFormat.ISODate)
     
     def to_dict(self):
         return {
@@ -34,6 +40,152 @@ class Goal:
         goal.last_updated = data['last_updated']
         return goal
 
+class SystemClock:
+    """Wall-clock time source backed by QTimer and QDate.
+
+    PomodoroApp only talks to time through this interface, so a virtual
+    clock (see replay.py) can drive the same state machine without waiting.
+    """
+
+    def today(self):
+        """Current date as an ISO string"""
+        return QDate.currentDate().toString(Qt.DateFormat.ISODate)
+
+    def now(self):
+        """Seconds since the epoch, comparable with focus room deadlines"""
+        return time.time()
+
+    def create_timer(self, parent):
+        """Timer with start(msec), stop(), setSingleShot() and a timeout signal"""
+        return QTimer(parent)
+
+def draw_daily_chart(painter, width, height, theme, days):
+    """Bar per day: days is a list of (label, hours)"""
+    top = max([hours for _, hours in days] + [1])
+    slot = width / max(len(days), 1)
+    painter.setFont(QFont("Georgia", 8))
+    for i, (label, hours) in enumerate(days):
+        bar = (height - 16) * hours / top
+        painter.fillRect(QRectF(i * slot + slot * 0.15, height - 16 - bar, slot * 0.7, bar), QColor(theme['text']))
+        painter.setPen(QColor(theme['button_text']))
+        painter.drawText(QRectF(i * slot, height - 14, slot, 14), Qt.AlignmentFlag.AlignCenter, label)
+
+
+def draw_goal_chart(painter, width, height, theme, goals):
+    """Bar per goal against its target: goals is a list of (name, completed, target)"""
+    row = height / max(len(goals), 1)
+    label_width = width * 0.3
+    painter.setFont(QFont("Georgia", 9))
+    for i, (name, completed, target) in enumerate(goals):
+        y = i * row + row * 0.2
+        track = QRectF(label_width, y, width - label_width, row * 0.6)
+        painter.fillRect(track, QColor(theme['progress_bg']))
+        done = track.adjusted(0, 0, -track.width() * (1 - min(completed / target, 1)), 0)
+        painter.fillRect(done, QColor(theme['text']))
+        painter.setPen(QColor(theme['button_text']))
+        painter.drawText(QRectF(0, y, label_width - 6, row * 0.6),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight, name)
+
+
+def draw_weekly_chart(painter, width, height, theme, weeks):
+    """Line of focus hours per week: weeks is a list of (label, hours)"""
+    if not weeks:
+        return
+    top = max([hours for _, hours in weeks] + [1])
+    step = width / max(len(weeks) - 1, 1)
+    points = [QPointF(i * step, (height - 4) * (1 - hours / top) + 2) for i, (_, hours) in enumerate(weeks)]
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(QPen(QColor(theme['text']), 2))
+    painter.drawPolyline(QPolygonF(points))
+
+
+class ChartRenderSignals(QObject):
+    finished = pyqtSignal(object, QImage)
+
+
+class ChartRenderJob(QRunnable):
+    """Renders a chart into a QImage on the thread pool"""
+
+    def __init__(self, draw, key, data, theme, size):
+        super().__init__()
+        self.draw = draw
+        self.key = key
+        self.data = data
+        self.theme = theme
+        self.size = size
+        self.signals = ChartRenderSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.key, render_chart(self.draw, self.data, self.theme, self.size))
+
+
+def render_chart(draw, data, theme, size):
+    image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    draw(painter, size.width(), size.height(), theme, data)
+    painter.end()
+    return image
+
+
+class ChartTile(QWidget):
+    """A chart drawn once into a cached pixmap.
+
+    The pixmap is keyed by whatever identifies its data and theme (see
+    PomodoroApp.refresh_charts); paintEvent only blits it, and set_data()
+    redraws only when the key changes. Charts with more than
+    ASYNC_POINTS points are rendered on the thread pool and swapped in when
+    done, while the previous pixmap stays on screen.
+    """
+
+    ASYNC_POINTS = 60
+
+    def __init__(self, draw, height):
+        super().__init__()
+        self.draw = draw
+        self.key = None
+        self.data = None
+        self.theme = None
+        self.pixmap = None
+        self.jobs = {}
+        self.setFixedHeight(height)
+
+    def needs_render(self, key):
+        return key != self.key
+
+    def set_data(self, key, data, theme):
+        if not self.needs_render(key):
+            return
+        self.key = key
+        self.data = data
+        self.theme = theme
+        if len(data) > self.ASYNC_POINTS:
+            job = ChartRenderJob(self.draw, key, data, theme, self.size())
+            job.signals.finished.connect(self.swap_in)
+            self.jobs[key] = job
+            QThreadPool.globalInstance().start(job)
+        else:
+            self.pixmap = QPixmap.fromImage(render_chart(self.draw, data, theme, self.size()))
+            self.update()
+
+    def swap_in(self, key, image):
+        self.jobs.pop(key, None)
+        if key == self.key:  # A newer render may have been requested meanwhile
+            self.pixmap = QPixmap.fromImage(image)
+            self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.key is not None:
+            key, self.key = self.key, None
+            self.set_data(key, self.data, self.theme)
+
+    def paintEvent(self, event):
+        if self.pixmap:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self.pixmap)
+
+
 class PomodoroApp(QWidget):
 
     def init_ui(self):
@@ -80,6 +232,7 @@ class PomodoroApp(QWidget):
         self.stats_btn = QPushButton("Stats")
         self.stats_btn.setStyleSheet("font-size: 14px; padding: 8px;")
         self.stats_btn.clicked.connect(lambda: self.stacked_widget.setCurrentIndex(1))  # Stats page is index 1
+        self.stacked_widget.currentChanged.connect(self.refresh_charts)
     
         self.goals_btn = QPushButton("Goals")
         self.goals_btn.setStyleSheet("font-size: 14px; padding: 8px;")
@@ -119,8 +272,9 @@ class PomodoroApp(QWidget):
     # Apply to all labels (including stats page)
         for label in [self.timer_label, self.status_label, self.current_goal_label, 
                  self.goal_progress_label, self.sessions_label,
-                 self.total_sessions_label, self.total_hours_label]:
+                 self.total_sessions_label, self.total_hours_label] + self.chart_titles:
             label.setStyleSheet(f"color: {theme['text']};")
+        self.refresh_charts()
     
     # Button style - removed outline by setting border: none
         button_style = f"""
@@ -247,14 +401,14 @@ class PomodoroApp(QWidget):
         
         layout.addLayout(button_layout)
 
-        # Goal selection
-        if self.goals:
-            goal_select_layout = QHBoxLayout()
-            self.goal_select_btn = QPushButton("Switch Goal")
-            self.goal_select_btn.setStyleSheet("font-size: 14px; padding: 8px;")
-            self.goal_select_btn.clicked.connect(self.show_goal_selection)
-            goal_select_layout.addWidget(self.goal_select_btn)
-            layout.addLayout(goal_select_layout)
+        # Goal selection (hidden until there is a goal to switch to)
+        goal_select_layout = QHBoxLayout()
+        self.goal_select_btn = QPushButton("Switch Goal")
+        self.goal_select_btn.setStyleSheet("font-size: 14px; padding: 8px;")
+        self.goal_select_btn.clicked.connect(self.show_goal_selection)
+        self.goal_select_btn.setVisible(bool(self.goals))
+        goal_select_layout.addWidget(self.goal_select_btn)
+        layout.addLayout(goal_select_layout)
 
         # Timer progress bar
         self.progress = QProgressBar()
@@ -299,6 +453,19 @@ class PomodoroApp(QWidget):
         self.total_hours_label.setFont(QFont("Georgia", 14))
         layout.addWidget(self.total_hours_label)
 
+        self.chart_titles = []
+        self.daily_chart = ChartTile(draw_daily_chart, 140)
+        self.goal_chart = ChartTile(draw_goal_chart, 120)
+        self.weekly_chart = ChartTile(draw_weekly_chart, 100)
+        for text, chart in [("Focus per day (last 14 days)", self.daily_chart),
+                            ("Goals today", self.goal_chart),
+                            ("Weekly trend", self.weekly_chart)]:
+            chart_title = QLabel(text)
+            chart_title.setFont(QFont("Georgia", 12))
+            self.chart_titles.append(chart_title)
+            layout.addWidget(chart_title)
+            layout.addWidget(chart)
+
     # Stats will automatically update when theme changes
     # because we included them in apply_theme()
 
@@ -393,7 +560,7 @@ class PomodoroApp(QWidget):
                     QMessageBox.warning(self, "Limit Reached", "You can have maximum 5 goals!")
                     return
                 
-                new_goal = Goal(name, target)
+                new_goal = Goal(name, target, last_updated=self.clock.today())
                 self.goals.append(new_goal)
                 self.save_goals()
                 self.update_goals_list()
@@ -489,12 +656,26 @@ class PomodoroApp(QWidget):
 
 
     def update_goals_list(self):
-        self.goals_list.clear()
-        for i, goal in enumerate(self.goals):
-            item_text = f"{goal.name} - {goal.completed_hours}/{goal.target_hours} hours"
-            self.goals_list.addItem(item_text)
+        self.fill_list(self.goals_list, [
+            f"{goal.name} - {goal.completed_hours}/{goal.target_hours} hours" for goal in self.goals
+        ])
+        for i in range(self.goals_list.count()):
             if i == self.current_goal_index:
                 self.goals_list.item(i).setBackground(QColor("#f8c8dc"))
+            else:
+                self.goals_list.item(i).setBackground(QBrush())
+        self.goal_select_btn.setVisible(bool(self.goals))
+
+    def fill_list(self, list_widget, texts):
+        """Make list_widget show texts, reusing the items it already has"""
+        while list_widget.count() > len(texts):
+            list_widget.takeItem(list_widget.count() - 1)
+        for i, text in enumerate(texts):
+            if i < list_widget.count():
+                if list_widget.item(i).text() != text:
+                    list_widget.item(i).setText(text)
+            else:
+                list_widget.addItem(text)
 
     def add_goal(self):
         if len(self.goals) >= 5:
@@ -514,46 +695,52 @@ class PomodoroApp(QWidget):
             QMessageBox.warning(self, "Invalid Input", "Please enter a number between 1 and 12 for target hours!")
             return
             
-        self.goals.append(Goal(name, target))
+        self.goals.append(Goal(name, target, last_updated=self.clock.today()))
         self.save_goals()
         self.update_goals_list()
         self.goal_name_input.clear()
         self.target_hours_input.clear()
         
-        # If this is the first goal, set it as current and refresh timer page
+        # If this is the first goal, set it as current on the timer page
         if len(self.goals) == 1:
-            self.current_goal_index = 0
-            self.stacked_widget.removeWidget(self.timer_page)
-            self.timer_page = QWidget()
-            self.setup_timer_page()
-            self.stacked_widget.insertWidget(0, self.timer_page)
+            self.set_current_goal(0)
             self.stacked_widget.setCurrentIndex(0)
 
     def show_goal_selection(self):
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Select Goal")
-        dialog.setFixedSize(300, 300)
-        
-        layout = QVBoxLayout(dialog)
-        
-        list_widget = QListWidget()
-        for goal in self.goals:
-            list_widget.addItem(goal.name)
-        layout.addWidget(list_widget)
-        
-        select_btn = QPushButton("Select")
-        select_btn.clicked.connect(lambda: self.select_goal(list_widget.currentRow(), dialog))
-        layout.addWidget(select_btn)
-        
-        dialog.exec()
+        self.goal_selection_dialog().exec()
+
+    def goal_selection_dialog(self):
+        """The goal picker, built on first use and refreshed on every later one"""
+        if self.goal_dialog is None:
+            self.goal_dialog = QDialog(self)
+            self.goal_dialog.setWindowTitle("Select Goal")
+            self.goal_dialog.setFixedSize(300, 300)
+
+            layout = QVBoxLayout(self.goal_dialog)
+
+            self.goal_dialog_list = QListWidget()
+            layout.addWidget(self.goal_dialog_list)
+
+            select_btn = QPushButton("Select")
+            select_btn.clicked.connect(
+                lambda: self.select_goal(self.goal_dialog_list.currentRow(), self.goal_dialog))
+            layout.addWidget(select_btn)
+
+        self.fill_list(self.goal_dialog_list, [goal.name for goal in self.goals])
+        self.goal_dialog_list.setCurrentRow(self.current_goal_index)
+        return self.goal_dialog
 
     def select_goal(self, index, dialog):
         if 0 <= index < len(self.goals):
-            self.current_goal_index = index
-            self.current_goal_label.setText("Current Goal: " + self.goals[self.current_goal_index].name)
-            self.update_goal_progress_label()
+            self.set_current_goal(index)
             dialog.close()
 
+    def set_current_goal(self, index):
+        """Make goals[index] the goal credited by work sessions"""
+        self.current_goal_index = index
+        self.current_goal_label.setText("Current Goal: " + self.goals[self.current_goal_index].name)
+        self.update_goal_progress_label()
+
     def update_goal_progress_label(self):
         if self.goals:
             goal = self.goals[self.current_goal_index]
@@ -565,7 +752,8 @@ class PomodoroApp(QWidget):
             self.goal_progress_label.setText("No goals set")
 
     def check_daily_reset(self):
-        today = QDate.currentDate().toString(Qt.DateFormat.ISODate)
+        today = self.clock.today()
+        self.current_day = today
         for goal in self.goals:
             if goal.last_updated != today:
                 goal.completed_hours = 0
@@ -575,17 +763,63 @@ class PomodoroApp(QWidget):
     def save_goals(self):
         data = {
             'goals': [goal.to_dict() for goal in self.goals],
-            'current_goal_index': self.current_goal_index
+            'current_goal_index': self.current_goal_index,
+            'history': self.history
         }
-        with open('goals.json', 'w') as f:
+        with open(self.goals_path, 'w') as f:
             json.dump(data, f)
+        self.refresh_charts()
+
+    def refresh_charts(self):
+        """Redraw charts whose data or theme changed, if the Stats page is showing"""
+        if not hasattr(self, 'stacked_widget') or self.stacked_widget.currentWidget() is not self.stats_page:
+            return
+        theme_name = 'dark' if self.is_dark_mode else 'light'
+        theme = self.current_theme
+        # History charts also depend on the date: their last bar is today
+        history_key = (self.history_version, self.clock.today(), theme_name)
+        if self.daily_chart.needs_render(history_key):
+            self.daily_chart.set_data(history_key, self.daily_focus(14), theme)
+        if self.weekly_chart.needs_render(history_key):
+            self.weekly_chart.set_data(history_key, self.weekly_focus(), theme)
+        # A handful of goals is cheaper to compare than to version
+        goals = tuple((g.name, g.completed_hours, g.target_hours) for g in self.goals)
+        self.goal_chart.set_data((goals, theme_name), goals, theme)
+
+    def daily_focus(self, days):
+        """(label, hours) for each of the last `days` days, oldest first"""
+        today = QDate.fromString(self.clock.today(), Qt.DateFormat.ISODate)
+        result = []
+        for offset in range(days - 1, -1, -1):
+            day = today.addDays(-offset)
+            result.append((day.toString("d"), self.history.get(day.toString(Qt.DateFormat.ISODate), 0)))
+        return result
+
+    def weekly_focus(self):
+        """(label, hours) for every week since the first recorded session"""
+        if not self.history:
+            return []
+        weeks = {}
+        for day, hours in self.history.items():
+            week = QDate.fromString(day, Qt.DateFormat.ISODate).weekNumber()
+            weeks[week] = weeks.get(week, 0) + hours
+        result = []
+        first = QDate.fromString(min(self.history), Qt.DateFormat.ISODate)
+        monday = first.addDays(1 - first.dayOfWeek())
+        today = QDate.fromString(self.clock.today(), Qt.DateFormat.ISODate)
+        while monday <= today:
+            week, year = monday.weekNumber()
+            result.append((f"{year}-W{week:02d}", weeks.get((week, year), 0)))
+            monday = monday.addDays(7)
+        return result
 
     def load_goals(self):
-        if os.path.exists('goals.json'):
-            with open('goals.json', 'r') as f:
+        if os.path.exists(self.goals_path):
+            with open(self.goals_path, 'r') as f:
                 data = json.load(f)
                 self.goals = [Goal.from_dict(goal_data) for goal_data in data['goals']]
                 self.current_goal_index = data.get('current_goal_index', 0)
+                self.history = data.get('history', {})
         else:
             self.goals = []
 
@@ -594,16 +828,35 @@ class PomodoroApp(QWidget):
 
     def update_timer(self):
         """Countdown timer that updates every second"""
+        if self.clock.today() != self.current_day:
+            # Crossed midnight while running
+            self.check_daily_reset()
+            self.update_goal_progress_label()
         if self.current_time > 0:
             self.current_time -= 1
             self.update_display()
+        elif self.room_socket:
+            # In a focus room the server announces the next phase
+            return
         else:
             self.timer_complete()
             self.sound.play()
             if self.is_work:
-                QMessageBox.information(self, "Great Job!", "You're doing amazing! Keep going 💪")
+                self.notify("Great Job!", "You're doing amazing! Keep going 💪")
             else:
-                QMessageBox.information(self, "Nice Break!", "Hope you feel refreshed! 🌟")
+                self.notify("Nice Break!", "Hope you feel refreshed! 🌟")
+
+    def skip_ticks(self, count):
+        """Apply up to count plain countdown ticks at once, for virtual clocks.
+
+        Stops short of the tick that would complete the phase, and returns
+        how many ticks were applied. The caller keeps midnight out of range.
+        """
+        skipped = min(count, self.current_time)
+        if skipped:
+            self.current_time -= skipped
+            self.update_display()
+        return skipped
 
     def update_display(self):
         """Update all UI elements with current timer state"""
@@ -617,36 +870,65 @@ class PomodoroApp(QWidget):
             self.progress.setRange(0, self.work_time)
             self.progress.setValue(self.current_time)
         else:
-            if self.sessions_completed % 4 == 0:
+            if self.is_long_break():
                 self.progress.setRange(0, self.long_break)
             else:
                 self.progress.setRange(0, self.short_break)
             self.progress.setValue(self.current_time)
         
-        # Update status color
+        # Update status color (restyling is expensive, so only on change)
         if self.is_work:
-            self.status_label.setStyleSheet(f"color: {self.current_theme['text']};")
+            status_style = f"color: {self.current_theme['text']};"
         else:
-            if self.sessions_completed % 4 == 0:
-                self.status_label.setStyleSheet("color: #4CAF50;")  # Green for long break
+            if self.is_long_break():
+                status_style = "color: #4CAF50;"  # Green for long break
             else:
-                self.status_label.setStyleSheet("color: #64B5F6;")  # Blue for short break
+                status_style = "color: #64B5F6;"  # Blue for short break
+        if self.status_label.styleSheet() != status_style:
+            self.status_label.setStyleSheet(status_style)
 
     def toggle_timer(self):
         """Toggle between play and pause states"""
+        if self.room_socket:
+            self.send_room_action("pause" if self.is_running else "start")
+            return
         if not self.is_running:
             self.start_timer()
             self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause))
         else:
             self.pause_timer()
-            QTimer.singleShot(60000, self.check_if_still_paused)
+            self.pause_reminder.start(60000)
             self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+            self.emit_pause()
+
+    def emit_pause(self):
+        """Tell hooks a running session was stopped (pause, reset, room pause)"""
+        self.hooks.emit("pause", phase=self.phase_name(), remaining=self.current_time,
+                        goal=self.current_goal_name(), time=self.clock.now())
+
+    def phase_name(self):
+        """"work", "short_break" or "long_break", as used by hooks and focus rooms"""
+        if self.is_work:
+            return "work"
+        return "long_break" if self.is_long_break() else "short_break"
+
+    def is_long_break(self):
+        if self.room_phase:
+            # A room keeps its own session count, separate from ours
+            return self.room_phase == "long_break"
+        return self.sessions_completed % 4 == 0
+
+    def current_goal_name(self):
+        return self.goals[self.current_goal_index].name if self.goals else None
 
     def start_timer(self):
         """Start the timer"""
         if not self.is_running:
             self.is_running = True
+            self.pause_reminder.stop()
             self.timer.start(1000)  # Update every second
+            self.hooks.emit("session_start", phase=self.phase_name(), remaining=self.current_time,
+                            goal=self.current_goal_name(), time=self.clock.now())
 
     def pause_timer(self):
         """Pause the timer"""
@@ -655,8 +937,13 @@ class PomodoroApp(QWidget):
 
     def reset_timer(self):
         """Reset the timer to initial state"""
+        if self.room_socket:
+            self.send_room_action("reset")
+            return
+        if self.is_running:
+            self.emit_pause()
         self.pause_timer()
-        QTimer.singleShot(60000, self.check_if_still_paused)
+        self.pause_reminder.start(60000)
         self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
         if self.is_work:
             self.current_time = self.work_time
@@ -669,38 +956,30 @@ class PomodoroApp(QWidget):
 
     def check_if_still_paused(self):
         if not self.is_running:
-            QMessageBox.information(self, "Still paused?", "Take a break—but don’t forget to resume!")
+            self.notify("Still paused?", "Take a break—but don’t forget to resume!")
+
+    def notify(self, title, message):
+        """Show an informational popup to the user"""
+        QMessageBox.information(self, title, message)
 
     def timer_complete(self):
         """Handle when timer reaches zero"""
         self.pause_timer()
+        self.hooks.emit("session_complete", phase=self.phase_name(), goal=self.current_goal_name(),
+                        time=self.clock.now())
     
         if self.is_work:
-            if self.goals:
-                self.goals[self.current_goal_index].completed_hours += 25/60
-                self.save_goals()
-                self.update_goal_progress_label()
-        
-            self.sessions_completed += 1
-        # Update stats labels
-            if hasattr(self, 'total_sessions_label'):
-                self.total_sessions_label.setText(f"Total Pomodoros: {self.sessions_completed}")
-                total_hours = sum(g.completed_hours for g in self.goals)
-                self.total_hours_label.setText(f"Total Hours Focused: {total_hours:.1f}")
-            if self.sound:
-                self.sound.play()
-    
-    # ... rest of the method ...
+            self.record_work_session()
             if self.sessions_completed % 4 == 0:
-                QMessageBox.information(self, "Time's up!", "Take a long break!")
+                self.notify("Time's up!", "Take a long break!")
                 self.current_time = self.long_break
             else:
-                QMessageBox.information(self, "Time's up!", "Take a short break!")
+                self.notify("Time's up!", "Take a short break!")
                 self.current_time = self.short_break
             self.is_work = False
             self.status_label.setText("Break Time")
         else:
-            QMessageBox.information(self, "Break's over!", "Time to work!")
+            self.notify("Break's over!", "Time to work!")
             self.current_time = self.work_time
             self.is_work = True
             self.status_label.setText("Work Time")
@@ -708,10 +987,116 @@ class PomodoroApp(QWidget):
         self.update_display()
         self.start_timer()  # Auto-start next session
 
-    def __init__(self):
+    def record_work_session(self, seconds=None):
+        """Credit a finished work session to the current goal and the stats.
+
+        `seconds` is the length of the session, the local work time unless
+        the session was a focus room's.
+        """
+        hours = (self.work_time if seconds is None else seconds) / 3600
+        today = self.clock.today()
+        self.history[today] = self.history.get(today, 0) + hours
+        self.history_version += 1
+        if self.goals:
+            goal = self.goals[self.current_goal_index]
+            goal.completed_hours += hours
+            self.update_goal_progress_label()
+            self.hooks.emit("goal_progress", goal=goal.name, completed_hours=goal.completed_hours,
+                            target_hours=goal.target_hours, time=self.clock.now())
+        self.save_goals()
+
+        self.sessions_completed += 1
+    # Update stats labels
+        if hasattr(self, 'total_sessions_label'):
+            self.total_sessions_label.setText(f"Total Pomodoros: {self.sessions_completed}")
+            total_hours = sum(g.completed_hours for g in self.goals)
+            self.total_hours_label.setText(f"Total Hours Focused: {total_hours:.1f}")
+        if self.sound:
+            self.sound.play()
+
+    def join_room(self, url, room):
+        """Follow a shared focus room (see focus_rooms.py) instead of the local cycle"""
+        if QWebSocket is None:
+            QMessageBox.warning(self, "Focus Rooms", "Joining a room needs the PyQt6 QtWebSockets module")
+            return
+        self.leave_room()
+        self.room_name = room
+        socket = self.room_socket = QWebSocket()
+        socket.setParent(self)
+        socket.connected.connect(lambda: self.send_room_action("join"))
+        socket.textMessageReceived.connect(self.apply_room_state)
+        socket.errorOccurred.connect(lambda error: self.room_connection_lost(socket))
+        socket.disconnected.connect(lambda: self.room_connection_lost(socket))
+        socket.open(QUrl(url))
+
+    def leave_room(self):
+        if self.room_socket:
+            socket = self.room_socket
+            # Cleared first so the disconnect this causes is not treated as a failure
+            self.room_socket = None
+            self.room_name = None
+            self.room_phase = None
+            self.room_sessions = None
+            self.room_work_time = None
+            socket.close()
+            socket.deleteLater()
+
+    def room_connection_lost(self, socket):
+        """Fall back to the local cycle when the room's server is gone"""
+        if socket is not self.room_socket:
+            return
+        reason = socket.errorString()
+        self.leave_room()
+        if self.is_running:
+            self.emit_pause()
+        self.pause_timer()
+        self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.update_display()
+        self.notify("Focus Room", f"Lost the connection to the focus room ({reason}).\n"
+                                  "The timer is paused and back to your own cycle.")
+
+    def send_room_action(self, action):
+        self.room_socket.sendTextMessage(json.dumps({'action': action, 'room': self.room_name}))
+
+    def apply_room_state(self, message):
+        """Mirror the room's phase; the countdown itself still runs locally"""
+        state = json.loads(message)
+        if state['phase'] != self.phase_name() and self.is_running:
+            self.hooks.emit("session_complete", phase=self.phase_name(), goal=self.current_goal_name(),
+                            time=self.clock.now())
+            self.pause_timer()  # start_timer below then announces the new session
+        # Only credit work this client followed: the previous state it saw
+        # must be the room's work phase that has just ended. The first state
+        # after joining never counts.
+        if (self.room_phase == 'work' and state['phase'] != 'work'
+                and state['sessions'] == self.room_sessions + 1):
+            self.record_work_session(self.room_work_time)
+        self.room_phase = state['phase']
+        self.room_sessions = state['sessions']
+        if state['phase'] == 'work':
+            self.room_work_time = state['duration']
+        self.is_work = state['phase'] == 'work'
+        self.status_label.setText("Work Time" if self.is_work else "Break Time")
+
+        if state['running']:
+            self.current_time = max(0, round(state['deadline'] - self.clock.now()))
+            self.start_timer()
+            self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause))
+        else:
+            if self.is_running:
+                self.emit_pause()
+            self.current_time = state['remaining']
+            self.pause_timer()
+            self.play_pause_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.update_display()
+
+    def __init__(self, clock=None, goals_path='goals.json', hooks=None):
         super().__init__()
         self.setWindowTitle("Pomodoro Timer")
         self.setFixedSize(600, 700)
+        self.clock = clock or SystemClock()
+        self.goals_path = goals_path
+        self.hooks = hooks or HookDispatcher()
 
 
     # === Theme initialization ===
@@ -746,15 +1131,33 @@ class PomodoroApp(QWidget):
         self.is_work = True
         self.sessions_completed = 0
         self.is_running = False
-        self.timer = QTimer(self)
+        self.timer = self.clock.create_timer(self)
         self.sound = QSoundEffect()
         self.sound.setVolume(0.5)  # 50% volume
         self.sound.setObjectName("timerBeep")
         self.timer.timeout.connect(self.update_timer)
+        # One reusable reminder; restarting it replaces any pending one
+        self.pause_reminder = self.clock.create_timer(self)
+        self.pause_reminder.setSingleShot(True)
+        self.pause_reminder.timeout.connect(self.check_if_still_paused)
+
+    # === Focus room (optional, see focus_rooms.py) ===
+        self.room_socket = None
+        self.room_name = None
+        self.room_phase = None
+        self.room_sessions = None
+        self.room_work_time = None
+
+    # === Dialogs, created lazily and reused ===
+        self.goal_dialog = None
+        self.goal_dialog_list = None
 
     # === Goals management ===
         self.goals = []
         self.current_goal_index = 0
+        self.history = {}
+        self.history_version = 0
+        self.current_day = self.clock.today()
         self.load_goals()
         self.check_daily_reset()
 
@@ -763,6 +1166,20 @@ class PomodoroApp(QWidget):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
-    window = PomodoroApp()
+    # Integrations: plugins/*.py each define register(dispatcher), and
+    # --log-events FILE / --post-events URL enable the built-in hooks
+    hooks = HookDispatcher()
+    plugin_errors = hooks.load_plugins(os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins"))
+    if "--log-events" in sys.argv[1:-1]:
+        hooks.register(LogHook(sys.argv[sys.argv.index("--log-events") + 1]))
+    if "--post-events" in sys.argv[1:-1]:
+        hooks.register(HttpHook(sys.argv[sys.argv.index("--post-events") + 1]))
+    window = PomodoroApp(hooks=hooks)
     window.show()
+    if plugin_errors:
+        QMessageBox.warning(window, "Plugins", "\n".join(plugin_errors))
+    # python pomodoro.py --room ws://localhost:8765 team
+    if "--room" in sys.argv[1:-2]:
+        i = sys.argv.index("--room")
+        window.join_room(sys.argv[i + 1], sys.argv[i + 2])
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,433 @@
+import sys
+import gc
+import json
+import os
+import heapq
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QApplication
+
+from pomodoro import PomodoroApp
+
+
+MS_PER_DAY = 24 * 60 * 60 * 1000
+
+
+class _Signal:
+    """Minimal stand-in for a Qt signal with connect/emit"""
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self):
+        for slot in list(self._slots):
+            slot()
+
+
+class VirtualTimer:
+    """QTimer look-alike whose ticks are scheduled on a VirtualClock.
+
+    If `skip` is set, a repeating timer fast-forwards after each tick:
+    skip(n) is offered the n following ticks that fall before the next
+    other event, the end of the current advance() and midnight, and
+    returns how many of them it absorbed without needing to be called.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.timeout = _Signal()
+        self.skip = None
+        self._interval = 0
+        self._generation = 0
+        self._active = False
+        self._single_shot = False
+
+    def setSingleShot(self, single_shot):
+        self._single_shot = single_shot
+
+    def start(self, msec=None):
+        if msec is not None:
+            self._interval = msec
+        self._generation += 1
+        self._active = True
+        self._schedule(self._generation)
+
+    def stop(self):
+        self._generation += 1
+        self._active = False
+
+    def isActive(self):
+        return self._active
+
+    def _schedule(self, generation):
+        self.clock.call_at(self.clock.now_ms + self._interval, lambda: self._fire(generation))
+
+    def _fire(self, generation):
+        # Stale entries from before a stop()/start() are simply dropped
+        if generation != self._generation:
+            return
+        if self._single_shot:
+            self._active = False
+            self.timeout.emit()
+            return
+        self.timeout.emit()
+        if generation != self._generation:
+            return  # A slot stopped or restarted the timer
+        if self.skip:
+            skipped = self.skip(self._free_ticks())
+            self.clock.now_ms += skipped * self._interval
+        self._schedule(generation)
+
+    def _free_ticks(self):
+        clock = self.clock
+        horizon = min(clock.next_due(), clock.now_ms + clock.ms_until_midnight())
+        return max(0, (horizon - clock.now_ms - 1) // self._interval)
+
+
+class VirtualClock:
+    """Clock for PomodoroApp where time only moves when advance() is called.
+
+    Events are kept in a heap and fired in deadline order, so idle stretches
+    (paused timer, overnight) cost nothing to skip over.
+    """
+
+    def __init__(self, start_date=None):
+        self.start_date = start_date or date(2024, 1, 1)
+        self.now_ms = 0
+        self.observer = None
+        self._queue = []
+        self._seq = 0
+        self._day = None
+        self._today = None
+        self._target = 0
+
+    def today(self):
+        day = self.now_ms // MS_PER_DAY
+        if day != self._day:
+            self._day = day
+            self._today = (self.start_date + timedelta(days=day)).isoformat()
+        return self._today
+
+    def now(self):
+        return self.now_ms / 1000
+
+    def create_timer(self, parent):
+        return VirtualTimer(self)
+
+    def call_at(self, due_ms, callback):
+        self._seq += 1
+        heapq.heappush(self._queue, (due_ms, self._seq, callback))
+
+    def next_due(self):
+        """Time of the next queued event, capped at the end of the current advance()"""
+        if self._queue:
+            return min(self._queue[0][0], self._target)
+        return self._target
+
+    def advance(self, msec):
+        """Move time forward by msec, firing everything that falls due"""
+        target = self._target = self.now_ms + msec
+        while self._queue and self._queue[0][0] <= target:
+            due, _, callback = heapq.heappop(self._queue)
+            self.now_ms = due
+            callback()
+            if self.observer:
+                self.observer()
+        self.now_ms = target
+
+    def ms_until_midnight(self):
+        return MS_PER_DAY - self.now_ms % MS_PER_DAY
+
+
+def write_goals_file(directory, goals, today):
+    """Fresh goals.json in directory with (name, target_hours) goals"""
+    path = os.path.join(directory, 'goals.json')
+    with open(path, 'w') as f:
+        json.dump({
+            'goals': [
+                {'name': name, 'target_hours': target, 'completed_hours': 0,
+                 'last_updated': today}
+                for name, target in goals
+            ],
+            'current_goal_index': 0
+        }, f)
+    return path
+
+
+class ReplayHarness:
+    """Drives a PomodoroApp on a VirtualClock and checks its invariants.
+
+    A script is a list of (action, argument) pairs:
+        ("start", None)        resume the timer if paused
+        ("pause", None)        pause the timer if running
+        ("reset", None)        press the reset button
+        ("switch_goal", i)     make goal i the current goal
+        ("wait", seconds)      let virtual time pass
+        ("next_day", seconds)  jump to midnight, then wait seconds more
+
+    Every timer event is followed by an invariant check; a violation raises
+    AssertionError describing the simulated time and state.
+    """
+
+    def __init__(self, goals=(("Focus", 4), ("Reading", 2)), start_date=None):
+        self.clock = VirtualClock(start_date)
+        self._tmpdir = tempfile.TemporaryDirectory()
+        goals_path = write_goals_file(self._tmpdir.name, goals, self.clock.today())
+
+        self.app = PomodoroApp(clock=self.clock, goals_path=goals_path)
+        self.app.timer.skip = self.app.skip_ticks
+        self.app.notify = self._record_notification
+        self.notifications = []
+        self.transitions = []
+        self.expected_hours = [0.0] * len(self.app.goals)
+        self._last = self._snapshot()
+        self.clock.observer = self.check_invariants
+
+    def close(self):
+        self.clock.observer = None
+        self.app.pause_timer()
+        self.app.deleteLater()
+        self._tmpdir.cleanup()
+
+    def _record_notification(self, title, message):
+        self.notifications.append((self.clock.now_ms, title))
+
+    def _snapshot(self):
+        app = self.app
+        return {
+            'is_work': app.is_work,
+            'sessions': app.sessions_completed,
+            'goal_index': app.current_goal_index,
+            'day': app.current_day,
+        }
+
+    def _fail(self, message):
+        raise AssertionError(
+            f"{message} at t={self.clock.now_ms // 1000}s ({self.clock.today()}), "
+            f"state={self._snapshot()}, current_time={self.app.current_time}"
+        )
+
+    def check_invariants(self):
+        app = self.app
+        last = self._last
+        now = self._snapshot()
+
+        if now['day'] != last['day']:
+            self.expected_hours = [0.0] * len(app.goals)
+            for goal in app.goals:
+                if goal.last_updated != now['day']:
+                    self._fail(f"goal '{goal.name}' not reset on day rollover")
+
+        if last['is_work'] and not now['is_work']:
+            if now['sessions'] != last['sessions'] + 1:
+                self._fail("work session completed without counting it")
+            self.expected_hours[last['goal_index']] += app.work_time / 3600
+            long_break = now['sessions'] % 4 == 0
+            expected_break = app.long_break if long_break else app.short_break
+            if app.current_time != expected_break:
+                self._fail(f"expected a {'long' if long_break else 'short'} break")
+            if app.goals[last['goal_index']].last_updated != self.clock.today():
+                self._fail("credited a goal that still belongs to a previous day")
+            self.transitions.append((self.clock.now_ms, 'break', now['sessions']))
+        elif not last['is_work'] and now['is_work']:
+            if now['sessions'] != last['sessions']:
+                self._fail("break completion changed the session count")
+            if app.current_time != app.work_time:
+                self._fail("work session did not start from a full work period")
+            self.transitions.append((self.clock.now_ms, 'work', now['sessions']))
+        elif now['sessions'] != last['sessions']:
+            self._fail("session count changed outside a work/break transition")
+
+        for goal, expected in zip(app.goals, self.expected_hours):
+            if abs(goal.completed_hours - expected) > 1e-9:
+                self._fail(f"goal '{goal.name}' has {goal.completed_hours}h, expected {expected}h")
+
+        if not 0 <= app.current_time <= max(app.work_time, app.long_break):
+            self._fail("countdown out of range")
+
+        self._last = now
+
+    def run(self, script):
+        app = self.app
+        for action, arg in script:
+            if action == "start":
+                if not app.is_running:
+                    app.toggle_timer()
+            elif action == "pause":
+                if app.is_running:
+                    app.toggle_timer()
+            elif action == "reset":
+                app.reset_timer()
+            elif action == "switch_goal":
+                app.set_current_goal(arg % len(app.goals))
+            elif action == "wait":
+                self.clock.advance(int(arg * 1000))
+            elif action == "next_day":
+                self.clock.advance(self.clock.ms_until_midnight() + int(arg * 1000))
+            else:
+                raise ValueError(f"Unknown replay action: {action}")
+            self.check_invariants()
+
+
+def random_script(rng, days):
+    """Plausible working days: a morning start, a few hours of focus
+    broken up by pauses, resets and goal switches, then overnight."""
+    script = []
+    for _ in range(days):
+        script.append(("next_day", rng.randint(7, 10) * 3600))
+        script.append(("start", None))
+        for _ in range(rng.randint(5, 40)):
+            roll = rng.random()
+            if roll < 0.6:
+                script.append(("wait", rng.randint(1, 50 * 60)))
+            elif roll < 0.8:
+                script.append(("pause", None))
+                script.append(("wait", rng.randint(1, 20 * 60)))
+                script.append(("start", None))
+            elif roll < 0.9:
+                script.append(("switch_goal", rng.randint(0, 4)))
+            else:
+                script.append(("reset", None))
+                script.append(("start", None))
+        script.append(("pause", None))
+    return script
+
+
+def replay(days=14, seed=0):
+    """Replay `days` random days and return the finished harness"""
+    harness = ReplayHarness()
+    harness.run(random_script(random.Random(seed), days))
+    return harness
+
+
+def soak(cycles=5000, warmup=200, max_memory_growth=256 * 1024, seed=0):
+    """Open the goal picker, switch goal, run, pause and reset, `cycles` times.
+
+    Fails with AssertionError if the app's QObject tree grows at all, or
+    traced Python memory grows by more than max_memory_growth bytes, between
+    the end of the warmup and the last cycle.
+    """
+    rng = random.Random(seed)
+    harness = ReplayHarness()
+    app = harness.app
+    app.notify = lambda title, message: None
+
+    def cycle():
+        dialog = app.goal_selection_dialog()
+        app.select_goal(rng.randrange(len(app.goals)), dialog)
+        harness.run([
+            ("start", None),
+            ("wait", rng.randint(1, 120)),
+            ("pause", None),
+            ("wait", rng.randint(1, 90)),
+            ("reset", None),
+        ])
+        harness.transitions.clear()
+        QApplication.processEvents()
+
+    try:
+        return check_growth(app, cycle, cycles, warmup, max_memory_growth)
+    finally:
+        harness.close()
+
+
+def soak_system_clock(cycles=500, warmup=50, max_memory_growth=256 * 1024, seed=0):
+    """Like soak(), but on the real SystemClock, so the QTimer-backed tick
+    and pause reminder are the ones being started and stopped."""
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        goals_path = write_goals_file(directory, (("Focus", 4), ("Reading", 2)), date.today().isoformat())
+        app = PomodoroApp(goals_path=goals_path)
+        app.notify = lambda title, message: None
+
+        def cycle():
+            dialog = app.goal_selection_dialog()
+            app.select_goal(rng.randrange(len(app.goals)), dialog)
+            app.toggle_timer()
+            QApplication.processEvents()
+            app.toggle_timer()
+            if not app.pause_reminder.isActive():
+                raise AssertionError("pausing did not arm the reminder")
+            app.reset_timer()
+            app.start_timer()
+            if app.pause_reminder.isActive():
+                raise AssertionError("starting did not cancel the reminder")
+            app.pause_timer()
+            QApplication.processEvents()
+
+        try:
+            return check_growth(app, cycle, cycles, warmup, max_memory_growth)
+        finally:
+            app.pause_timer()
+            app.pause_reminder.stop()
+            app.deleteLater()
+            QApplication.processEvents()
+
+
+def check_growth(app, cycle, cycles, warmup, max_memory_growth):
+    """Run cycle() warmup + cycles times and fail on QObject or memory growth"""
+    def measure():
+        gc.collect()
+        return len(app.findChildren(QObject)), tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.start()
+    try:
+        for _ in range(warmup):
+            cycle()
+        objects_before, memory_before = measure()
+        for _ in range(cycles):
+            cycle()
+        objects_after, memory_after = measure()
+    finally:
+        tracemalloc.stop()
+
+    report = {
+        "cycles": cycles,
+        "objects": (objects_before, objects_after),
+        "memory_growth": memory_after - memory_before,
+    }
+    if objects_after > objects_before:
+        raise AssertionError(f"QObject count grew from {objects_before} to {objects_after} over {cycles} cycles")
+    if report["memory_growth"] > max_memory_growth:
+        raise AssertionError(f"Traced memory grew by {report['memory_growth']} bytes over {cycles} cycles")
+    return report
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "soak":
+        cycles = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+        # The soak is meant for headless machines
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication.instance() or QApplication(sys.argv)
+        for label, report in [("virtual clock", soak(cycles)),
+                              ("system clock", soak_system_clock(max(cycles // 10, 1)))]:
+            print(f"Soaked {report['cycles']} cycles on the {label}: "
+                  f"QObjects {report['objects'][0]} -> {report['objects'][1]}, "
+                  f"traced memory {report['memory_growth']:+d} bytes")
+        return
+
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    started = time.perf_counter()
+    harness = replay(days, seed)
+    elapsed = time.perf_counter() - started
+
+    print(f"Replayed {days} days (seed {seed}) in {elapsed * 1000:.0f} ms")
+    print(f"Pomodoros: {harness.app.sessions_completed}, "
+          f"phase transitions: {len(harness.transitions)}, "
+          f"notifications: {len(harness.notifications)}")
+    harness.close()
+
+
+if __name__ == "__main__":
+    main()